@@ -11,19 +11,14 @@ from merit import Case, validate_cases_for_sut
 # =============================== Define SUT ===============================
 
 
+_ANSWERS = {"France": "Paris", "Germany": "Berlin", "rock": "Metallica", "pop": "Lady Gaga"}
+
+
 def simple_chatbot(prompt: str) -> str:
-    if "verbose" in prompt:
-        answer = "What an excellent question! The answer is: "
-    else:
-        answer = ""
-    if "France" in prompt:
-        return answer + "Paris"
-    if "Germany" in prompt:
-        return answer + "Berlin"
-    if "rock" in prompt:
-        return answer + "Metallica"
-    if "pop" in prompt:
-        return answer + "Lady Gaga"
+    prefix = "What an excellent question! The answer is: " if "verbose" in prompt else ""
+    for topic, answer in _ANSWERS.items():
+        if topic in prompt:
+            return prefix + answer
     raise ValueError(f"Unknown query: {prompt}")
 
 
@@ -80,7 +75,7 @@ def merit_iter_cases_basic_usage(case: Case[ExampleReferences]):
 
 
 # Filter cases in code
-@merit.iter_cases(*[c for c in all_cases if "geography" in c.tags])
+@merit.iter_cases(c for c in all_cases if "geography" in c.tags)
 def merit_iter_cases_only_geography(case: Case[ExampleReferences]):
     response = simple_chatbot(**case.sut_input_values)
 
@@ -9,15 +9,20 @@ from merit.context import metrics
 # - Propagate values from both metrics into an accuracy metric to check if AI system is ready for production
 
 
+_BAND_QUALITY = {
+    "Metallica": True,
+    "Whitesnake": True,
+    "Led Zeppelin": False,
+    "Megadeth": True,
+    "Nickelback": True,
+    "Limp Bizkit": False,
+}
+
+
 def band_quality_classifier(query: str) -> bool:
-    if "Metallica" in query or "Whitesnake" in query:
-        return True
-    if "Led Zeppelin" in query:
-        return False
-    if "Megadeth" in query or "Nickelback" in query:
-        return True
-    if "Limp Bizkit" in query:
-        return False
+    for band, quality in _BAND_QUALITY.items():
+        if band in query:
+            return quality
     raise ValueError(f"Unknown query: {query}")
 
 
@@ -83,25 +88,24 @@ def merit_expected_false(band: str, false_positives: Metric):
 # - Calculate average hallucinations number across all cases to understand the overall system performance
 
 
+_CITY_LOCATIONS = {
+    "San Francisco": "California, USA",
+    "Boston": "Massachusetts, Canada",
+    "Chicago": "Washington, USA",
+    "Seattle": "Washington, USA",
+    "Miami": "California, USA",
+    "Houston": "California, Uzbekistan",
+    "Washington": "California, Canada",
+    "Denver": "Colorado, USA",
+    "Phoenix": "Arizona, USA",
+    "Austin": "Texas, USA",
+}
+
+
 def geography_bot(query: str) -> str:
-    if "San Francisco" in query:
-        return "California, USA"
-    if "Boston" in query:
-        return "Massachusetts, Canada"
-    if "Chicago" in query or "Seattle" in query:
-        return "Washington, USA"
-    if "Miami" in query:
-        return "California, USA"
-    if "Houston" in query:
-        return "California, Uzbekistan"
-    if "Washington" in query:
-        return "California, Canada"
-    if "Denver" in query:
-        return "Colorado, USA"
-    if "Phoenix" in query:
-        return "Arizona, USA"
-    if "Austin" in query:
-        return "Texas, USA"
+    for city, location in _CITY_LOCATIONS.items():
+        if city in query:
+            return location
     raise ValueError(f"Unknown query: {query}")
 
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import merit
 from merit.predicates import (
     follows_policy,
     has_conflicting_facts,
@@ -17,16 +20,12 @@ from merit.predicates import (
 # =============================== Define SUT ===============================
 
 
-def simple_chatbot(text: str) -> str:
-    if "France" in text:
-        return """
+_FRANCE = """
         France is a beautiful country located in Western Europe. 
         Its capital city is Paris, which is known for the Eiffel 
         Tower and croissants.
         """
-    if "Germany" in text:
-        if "markdown" in text:
-            return """
+_GERMANY_MARKDOWN = """
             # Germany
             ## Location
             Germany is located in Central Europe.
@@ -38,24 +37,35 @@ def simple_chatbot(text: str) -> str:
             ## Population
             Germany has a population of 83 million people.
             """
-        return """
+_GERMANY = """
             Germany, located in Central Europe, has Berlin as its capital. 
             Berlin is famous for its history, museums, and vibrant 
             cultural scene.
             """
-    if "rock" in text:
-        if "verbose" in text:
-            return """
+_ROCK_VERBOSE = """
             Metallica is the greatest rock band of all time. 
             James Hetfield is the lead singer and rhythm guitarist.
             Lars Ulrich is the drummer.
             Kirk Hammett is the lead guitarist.
             Robert Trujillo is the bass guitarist.
             """
-        return """
+_ROCK = """
             Metallica is the greatest rock band of all time. 
             James Hetfield is the lead singer and rhythm guitarist.
             """
+
+# (topic, detail keyword, answer, detailed answer), checked in priority order
+_ANSWERS = (
+    ("France", None, _FRANCE, _FRANCE),
+    ("Germany", "markdown", _GERMANY, _GERMANY_MARKDOWN),
+    ("rock", "verbose", _ROCK, _ROCK_VERBOSE),
+)
+
+
+def simple_chatbot(text: str) -> str:
+    for topic, detail, answer, detailed in _ANSWERS:
+        if topic in text:
+            return detailed if detail is not None and detail in text else answer
     return """
         I don't know.
         """
@@ -64,6 +74,12 @@ def simple_chatbot(text: str) -> str:
 # =============================== Run predicate tests ===============================
 
 
+@merit.resource(scope="suite")
+def rock_answer() -> str:
+    """Answer shared by every test in this file that asks about rock bands."""
+    return simple_chatbot("What is the greatest rock band of all time?")
+
+
 async def merit_predicates_combining():
     answer = simple_chatbot("What is the greatest rock band of all time? Be verbose.")
 
@@ -82,26 +98,30 @@ async def merit_predicates_facts_and_topics():
     )
 
     # has_facts and has_topics check if text contains all facts and topics from the reference text
-    assert await has_facts(answer, "Paris is a capital of France. France is a country in Europe.")
-    assert not await has_topics(answer, "Sports, sociology, politics, religion.")
-
-
-async def merit_predicates_conflicting_and_unsupported_facts():
-    answer = simple_chatbot("What is the greatest rock band of all time?")
-
-    # check if answer contradicts the reference
-    assert not await has_conflicting_facts(
-        answer, "Lady Gaga is the greatest pop singer of all time."
+    # independent predicates can be awaited together to overlap API round-trips
+    facts, topics = await asyncio.gather(
+        has_facts(answer, "Paris is a capital of France. France is a country in Europe."),
+        has_topics(answer, "Sports, sociology, politics, religion."),
     )
-
-    # check if any facts in the answer don't have evidence in the reference
-    assert not await has_unsupported_facts(
-        answer,
-        """James Alan Hetfield (born August 3, 1963) is an American musician. 
-        He is the lead vocalist, rhythm guitarist, co-founder, and a primary songwriter 
-        of the heavy metal band Metallica. Metallica is the greatest rock band of all time.
-        """,
+    assert facts
+    assert not topics
+
+
+async def merit_predicates_conflicting_and_unsupported_facts(rock_answer: str):
+    conflicting, unsupported = await asyncio.gather(
+        # check if answer contradicts the reference
+        has_conflicting_facts(rock_answer, "Lady Gaga is the greatest pop singer of all time."),
+        # check if any facts in the answer don't have evidence in the reference
+        has_unsupported_facts(
+            rock_answer,
+            """James Alan Hetfield (born August 3, 1963) is an American musician. 
+            He is the lead vocalist, rhythm guitarist, co-founder, and a primary songwriter 
+            of the heavy metal band Metallica. Metallica is the greatest rock band of all time.
+            """,
+        ),
     )
+    assert not conflicting
+    assert not unsupported
 
 
 async def merit_predicates_facts_match():
@@ -118,12 +138,13 @@ async def merit_predicates_facts_match():
     )
 
 
-async def merit_predicates_policy_follows():
-    answer = simple_chatbot("What is the greatest rock band of all time?")
-
-    # check if answer follows the policy
-    assert await follows_policy(answer, "Answer must be in English.")
-    assert await follows_policy(answer, "Must have at least one subjective statement.")
+@merit.parametrize(
+    "policy",
+    ["Answer must be in English.", "Must have at least one subjective statement."],
+)
+async def merit_predicates_policy_follows(policy: str, rock_answer: str):
+    # each policy runs as its own case, concurrently with the others
+    assert await follows_policy(rock_answer, policy)
 
 
 async def merit_predicates_style_match():
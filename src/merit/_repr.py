@@ -0,0 +1,53 @@
+"""Bounded ``repr`` for recording values in spans and stored tracebacks."""
+
+import reprlib
+from collections.abc import Collection
+from itertools import islice
+from typing import Any
+
+
+class OrderedRepr(reprlib.Repr):
+    """`reprlib.Repr` that caps size without changing how values read.
+
+    The stdlib version sorts dict keys and set items and elides the middle of
+    long strings. This one keeps iteration order and cuts strings at the end.
+    Pass a high ``maxlevel`` so small nested values are not collapsed.
+    """
+
+    def _repr_items(self, items: Collection[str], size: int, limit: int) -> str:
+        pieces = list(items)
+        if size > limit:
+            pieces.append(self.fillvalue)
+        return ", ".join(pieces)
+
+    def repr_dict(self, x: dict[Any, Any], level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{" + self.fillvalue + "}"
+        items = [
+            f"{self.repr1(k, level - 1)}: {self.repr1(v, level - 1)}"
+            for k, v in islice(x.items(), self.maxdict)
+        ]
+        return "{" + self._repr_items(items, len(x), self.maxdict) + "}"
+
+    def repr_set(self, x: set[Any], level: int) -> str:
+        if not x:
+            return "set()"
+        if level <= 0:
+            return "{" + self.fillvalue + "}"
+        items = [self.repr1(v, level - 1) for v in islice(x, self.maxset)]
+        return "{" + self._repr_items(items, len(x), self.maxset) + "}"
+
+    def repr_frozenset(self, x: frozenset[Any], level: int) -> str:
+        if not x:
+            return "frozenset()"
+        if level <= 0:
+            return "frozenset({" + self.fillvalue + "})"
+        items = [self.repr1(v, level - 1) for v in islice(x, self.maxfrozenset)]
+        return "frozenset({" + self._repr_items(items, len(x), self.maxfrozenset) + "})"
+
+    def repr_str(self, x: str, level: int) -> str:
+        if len(x) <= self.maxstring:
+            return repr(x)
+        return repr(x[: self.maxstring]) + self.fillvalue
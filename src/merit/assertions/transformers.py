@@ -1,4 +1,5 @@
 import ast
+import io
 
 
 class InjectAssertionDependenciesTransformer(ast.NodeTransformer):
@@ -66,12 +67,38 @@ class AssertTransformer(ast.NodeTransformer):
 
     def __init__(self, source: str | None = None) -> None:
         self.source = source
+        # Split once per module; every assert reads its context lines from here.
+        self.source_lines = source.splitlines() if source is not None else []
+        # Byte lines split like the parser does, so AST column offsets index them.
+        self.source_bytes_lines = (
+            [line.encode() for line in io.StringIO(source, newline="")]
+            if source is not None
+            else []
+        )
+
+    def source_segment(self, node: ast.expr | ast.stmt) -> str:
+        """Return the source text of ``node``, as `ast.get_source_segment` does.
+
+        The stdlib helper re-splits the whole module on every call; this reads
+        from the lines split once in ``__init__``.
+        """
+        lines = self.source_bytes_lines
+        first, last = node.lineno - 1, (node.end_lineno or node.lineno) - 1
+        if first == last:
+            return lines[first][node.col_offset : node.end_col_offset].decode()
+        return b"".join(
+            [
+                lines[first][node.col_offset :],
+                *lines[first + 1 : last],
+                lines[last][: node.end_col_offset],
+            ]
+        ).decode()
 
     def visit_Assert(self, node: ast.Assert):
         # Get the source segment of the assertion statement
         segment = None
         if self.source is not None:
-            segment = ast.get_source_segment(self.source, node)
+            segment = self.source_segment(node)
         expr_repr = (
             segment.strip()
             if isinstance(segment, str) and segment
@@ -81,7 +108,7 @@ class AssertTransformer(ast.NodeTransformer):
         lines_above = ""
         lines_below = ""
         if self.source is not None and node.lineno is not None:
-            source_lines = self.source.splitlines()
+            source_lines = self.source_lines
             start_index = max(0, node.lineno - 1)
             end_index = max(0, (node.end_lineno or node.lineno) - 1)
             above_lines = source_lines[max(0, start_index - 2) : start_index]
@@ -106,7 +133,7 @@ class AssertTransformer(ast.NodeTransformer):
 
         def expr_name(expr: ast.expr) -> str:
             if self.source is not None:
-                segment = ast.get_source_segment(self.source, expr)
+                segment = self.source_segment(expr)
                 if isinstance(segment, str) and segment:
                     return segment.strip()
             return ast.unparse(expr)
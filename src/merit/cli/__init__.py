@@ -12,7 +12,7 @@ from rich.console import Console
 
 from merit.config import MeritConfig, load_config
 from merit.testing import MeritTestDefinition, collect
-from merit.testing.runner import Runner
+from merit.testing.runner import Runner, new_event_loop
 
 
 # Backwards compatibility alias
@@ -30,7 +30,7 @@ def main() -> None:
         parser.print_help()
         raise SystemExit(0)
 
-    exit_code = asyncio.run(_run_tests(args, config))
+    exit_code = asyncio.run(_run_tests(args, config), loop_factory=new_event_loop)
     raise SystemExit(exit_code)
 
 
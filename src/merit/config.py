@@ -40,6 +40,28 @@ DEFAULT_CONFIG = MeritConfig(
     save_to_db=True,
 )
 
+# Config keys (dashed or underscored) mapped to MeritConfig attributes.
+_SECTION_KEYS = {
+    "test-paths": "test_paths",
+    "test_paths": "test_paths",
+    "include-tags": "include_tags",
+    "include_tags": "include_tags",
+    "exclude-tags": "exclude_tags",
+    "exclude_tags": "exclude_tags",
+    "keyword": "keyword",
+    "maxfail": "maxfail",
+    "verbosity": "verbosity",
+    "addopts": "addopts",
+    "concurrency": "concurrency",
+    "timeout": "timeout",
+    "db-path": "db_path",
+    "db_path": "db_path",
+    "save-to-db": "save_to_db",
+    "save_to_db": "save_to_db",
+}
+_LIST_ATTRS = frozenset({"test_paths", "include_tags", "exclude_tags", "addopts"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
 
 def load_config(start_path: str | Path | None = None) -> MeritConfig:
     """Load configuration from pyproject.toml or merit.toml."""
@@ -76,7 +98,7 @@ def load_config(start_path: str | Path | None = None) -> MeritConfig:
 
     env_db_enabled = os.getenv("MERIT_DB_ENABLED")
     if env_db_enabled is not None:
-        config.save_to_db = env_db_enabled.strip().lower() not in {"0", "false", "no", "off"}
+        config.save_to_db = env_db_enabled.strip().lower() not in _FALSE_VALUES
 
     if not config.test_paths:
         config.test_paths = list(DEFAULT_CONFIG.test_paths)
@@ -103,30 +125,11 @@ def _load_toml(path: Path) -> dict[str, Any]:
 
 def _apply_section(config: MeritConfig, section: dict[str, Any]) -> None:
     """Apply a single config section to the resolved config."""
-    mapping = {
-        "test-paths": "test_paths",
-        "test_paths": "test_paths",
-        "include-tags": "include_tags",
-        "include_tags": "include_tags",
-        "exclude-tags": "exclude_tags",
-        "exclude_tags": "exclude_tags",
-        "keyword": "keyword",
-        "maxfail": "maxfail",
-        "verbosity": "verbosity",
-        "addopts": "addopts",
-        "concurrency": "concurrency",
-        "timeout": "timeout",
-        "db-path": "db_path",
-        "db_path": "db_path",
-        "save-to-db": "save_to_db",
-        "save_to_db": "save_to_db",
-    }
-
     for key, value in section.items():
-        attr = mapping.get(key)
+        attr = _SECTION_KEYS.get(key)
         if attr is None:
             continue
-        if attr in {"test_paths", "include_tags", "exclude_tags", "addopts"}:
+        if attr in _LIST_ATTRS:
             if isinstance(value, list):
                 setattr(config, attr, [str(v) for v in value])
         elif attr == "verbosity":
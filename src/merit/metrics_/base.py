@@ -21,7 +21,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, ParamSpec
 from uuid import UUID
 
-from pydantic import validate_call
+from pydantic import TypeAdapter
 
 from merit.context import (
     METRIC_RESULTS_COLLECTOR,
@@ -38,6 +38,8 @@ if TYPE_CHECKING:
 
 P = ParamSpec("P")
 
+_SCALAR_TYPES = (int, float, bool)
+
 
 CalculatedValue = (
     int
@@ -50,6 +52,8 @@ CalculatedValue = (
     | tuple[float, float]
     | tuple[float, float, float]
 )
+# Validates and coerces values outside the plain numeric fast path of add_record.
+_CALCULATED_VALUE: TypeAdapter[CalculatedValue] = TypeAdapter(CalculatedValue)
 
 
 @dataclass
@@ -119,6 +123,8 @@ class MetricState:
         Frequency count of each unique raw value. Missing keys return 0.
     distribution : dict, optional
         Share of each unique raw value.
+    sorted_values : list of float, optional
+        Recorded values in ascending order, shared by order statistics.
     """
 
     len: int | None = None
@@ -137,6 +143,7 @@ class MetricState:
     percentiles: list[float] | None = None
     counter: Counter[int | float | bool] | None = None
     distribution: dict[int | float | bool, float] | None = None
+    sorted_values: list[float] | None = None
 
 
 @dataclass(slots=True)
@@ -162,15 +169,27 @@ class Metric:
     _values_lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
     _cache: MetricState = field(default_factory=MetricState, repr=False)
 
-    @validate_call
     def add_record(self, value: CalculatedValue) -> None:
         """Record one or more new data points.
 
         Parameters
         ----------
         value : int, float, bool, list of these, or tuple of these
-            The value(s) to add to the metric.
+            The value(s) to add to the metric. Other inputs, such as numeric
+            strings, are coerced with pydantic.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If ``value`` can't be coerced to a numeric value or sequence.
         """
+        if not (
+            isinstance(value, _SCALAR_TYPES)
+            or (
+                isinstance(value, list | tuple) and all(isinstance(v, _SCALAR_TYPES) for v in value)
+            )
+        ):
+            value = _CALCULATED_VALUE.validate_python(value)
         with self._values_lock:
             test_ctx = TEST_CONTEXT.get()
             if test_ctx is not None:
@@ -179,26 +198,19 @@ class Metric:
                 if test_ctx.item.id_suffix:
                     self.metadata.collected_from_cases.add(test_ctx.item.id_suffix)
 
+            now = datetime.now(UTC)
             if self.metadata.first_item_recorded_at is None:
-                self.metadata.first_item_recorded_at = datetime.now(UTC)
-            self.metadata.last_item_recorded_at = datetime.now(UTC)
+                self.metadata.first_item_recorded_at = now
+            self.metadata.last_item_recorded_at = now
             self._cache = MetricState()
             match value:
-                case list() as values:
+                case list() | tuple() as values:
+                    if not all(isinstance(v, _SCALAR_TYPES) for v in values):
+                        raise TypeError(
+                            "add_record only supports scalar or sequences of int|float|bool."
+                        )
                     self._raw_values.extend(values)
-                    self._float_values.extend(float(v) for v in values)
-
-                case tuple() as values:
-                    items: list[int | float | bool] = []
-                    for v in values:
-                        if isinstance(v, (int, float, bool)):
-                            items.append(v)
-                        else:
-                            raise TypeError(
-                                "add_record only supports scalar or sequences of int|float|bool."
-                            )
-                    self._raw_values.extend(items)
-                    self._float_values.extend(float(v) for v in items)
+                    self._float_values.extend(map(float, values))
 
                 case int() | float() | bool() as v:
                     self._raw_values.append(v)
@@ -209,6 +221,13 @@ class Metric:
                         "add_record only supports scalar or sequences of int|float|bool."
                     )
 
+    def _sorted_values(self) -> list[float]:
+        """Return the recorded values in ascending order, sorting once per change."""
+        with self._values_lock:
+            if self._cache.sorted_values is None:
+                self._cache.sorted_values = sorted(self._float_values)
+            return self._cache.sorted_values
+
     @property
     def raw_values(self) -> list[int | float | bool]:
         with self._values_lock:
@@ -242,7 +261,8 @@ class Metric:
                     )
                     self._cache.min = math.nan
                 else:
-                    self._cache.min = min(self._float_values)
+                    ordered = self._cache.sorted_values
+                    self._cache.min = ordered[0] if ordered else min(self._float_values)
             value = self._cache.min
             return value
 
@@ -258,7 +278,8 @@ class Metric:
                     value = math.nan
                     self._cache.max = value
                 else:
-                    self._cache.max = max(self._float_values)
+                    ordered = self._cache.sorted_values
+                    self._cache.max = ordered[-1] if ordered else max(self._float_values)
             value = self._cache.max
             return value
 
@@ -273,7 +294,11 @@ class Metric:
                     )
                     self._cache.median = math.nan
                 else:
-                    self._cache.median = statistics.median(self._float_values)
+                    values = self._sorted_values()
+                    mid = len(values) // 2
+                    self._cache.median = (
+                        values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+                    )
             value = self._cache.median
             return value
 
@@ -318,7 +343,7 @@ class Metric:
                     )
                     self._cache.std = math.nan
                 else:
-                    self._cache.std = statistics.stdev(self._float_values, xbar=self.mean)
+                    self._cache.std = math.sqrt(self.variance)
             value = self._cache.std
             return value
 
@@ -348,7 +373,7 @@ class Metric:
                     )
                     self._cache.pstd = math.nan
                 else:
-                    self._cache.pstd = statistics.pstdev(self._float_values, mu=self.mean)
+                    self._cache.pstd = math.sqrt(self.pvariance)
             value = self._cache.pstd
             return value
 
@@ -411,8 +436,9 @@ class Metric:
                     )
                     self._cache.percentiles = [math.nan] * 99
                 else:
+                    # quantiles() sorts its input; the presorted copy makes that linear.
                     self._cache.percentiles = statistics.quantiles(
-                        self._float_values, n=100, method="inclusive"
+                        self._sorted_values(), n=100, method="inclusive"
                     )
             value = self._cache.percentiles
             return value
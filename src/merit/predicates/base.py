@@ -78,6 +78,10 @@ class AsyncPredicate(Protocol):
 
 Predicate = AsyncPredicate | SyncPredicate
 
+# Both protocols share one call signature; binding against it is done on
+# every predicate call, so the signature is built once here.
+_CALL_SIGNATURE = signature(SyncPredicate.__call__)
+
 
 # Data model for predicate results
 
@@ -207,7 +211,7 @@ def predicate(func: Callable[..., bool] | Callable[..., Awaitable[bool]]) -> Pre
 
         @wraps(func)
         async def async_wrapper(*args, **kwargs) -> PredicateResult:
-            binded_args = signature(AsyncPredicate.__call__).bind(*args, **kwargs).arguments
+            binded_args = _CALL_SIGNATURE.bind(*args, **kwargs).arguments
             result = await func(*args, **kwargs)
             return PredicateResult(
                 value=bool(result),
@@ -223,7 +227,7 @@ def predicate(func: Callable[..., bool] | Callable[..., Awaitable[bool]]) -> Pre
 
     @wraps(func)
     def sync_wrapper(*args, **kwargs) -> PredicateResult:
-        binded_args = signature(SyncPredicate.__call__).bind(*args, **kwargs).arguments
+        binded_args = _CALL_SIGNATURE.bind(*args, **kwargs).arguments
         result = func(*args, **kwargs)
         return PredicateResult(
             value=bool(result),
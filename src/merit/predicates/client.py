@@ -7,6 +7,8 @@ import asyncio
 import logging
 import random
 import warnings
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager, nullcontext
 from enum import Enum
 from typing import Any
 
@@ -71,10 +73,27 @@ class PredicateAPISettings(BaseSettings):
     keepalive_expiry
         Close idle keep-alive connections after this many seconds
         (from ``MERIT_API_KEEPALIVE_EXPIRY``).
+    http2
+        Multiplex concurrent requests over HTTP/2 connections
+        (from ``MERIT_API_HTTP2``). Requires ``httpx[http2]``.
+    max_concurrent_requests
+        Maximum number of predicate requests in flight at once
+        (from ``MERIT_API_MAX_CONCURRENCY``). Extra requests wait for a free slot.
+        Unset by default, leaving concurrency bounded only by the connection pool.
+    cache_responses
+        Reuse the response of an identical earlier request instead of calling
+        the service again (from ``MERIT_API_CACHE_RESPONSES``). Non-strict
+        requests that differ only in line indentation share a response, except
+        for layout and style checks.
+    cache_max_entries
+        Number of cached responses kept before the least recently used one is
+        evicted (from ``MERIT_API_CACHE_MAX_ENTRIES``).
     retry_max_attempts
         Maximum number of attempts for a single request.
     retry_base_delay_s, retry_max_delay_s, retry_jitter_s
         Exponential backoff parameters (seconds).
+    retry_after_max_s
+        Upper bound for a server-provided ``Retry-After`` delay (seconds).
     retry_status_codes
         Status codes that trigger a retry.
     retry_on_server_errors
@@ -93,10 +112,19 @@ class PredicateAPISettings(BaseSettings):
     max_connections: int = 200
     max_keepalive_connections: int = 50
     keepalive_expiry: float = Field(default=30.0, validation_alias="MERIT_API_KEEPALIVE_EXPIRY")
+    http2: bool = Field(default=False, validation_alias="MERIT_API_HTTP2")
+    max_concurrent_requests: int | None = Field(
+        default=None, ge=1, validation_alias="MERIT_API_MAX_CONCURRENCY"
+    )
+    cache_responses: bool = Field(default=False, validation_alias="MERIT_API_CACHE_RESPONSES")
+    cache_max_entries: int = Field(
+        default=1024, ge=1, validation_alias="MERIT_API_CACHE_MAX_ENTRIES"
+    )
     retry_max_attempts: int = 4
     retry_base_delay_s: float = 0.05
     retry_max_delay_s: float = 1.0
     retry_jitter_s: float = 0.05
+    retry_after_max_s: float = 10.0
     retry_status_codes: list[int] = Field(default_factory=lambda: [408, 429])
     retry_on_server_errors: bool = True
 
@@ -112,6 +140,15 @@ class PredicateAPISettings(BaseSettings):
             )
 
 
+# Checks whose verdict can depend on indentation, so inputs are cached verbatim.
+_LAYOUT_SENSITIVE = frozenset({PredicateType.STRUCTURE_MATCH, PredicateType.STYLE_MATCH})
+
+
+def _normalize_lines(text: str) -> str:
+    """Strip surrounding whitespace from the text and each of its lines."""
+    return "\n".join(line.strip() for line in text.strip().splitlines())
+
+
 class PredicateAPIClient:
     """Thin wrapper around an httpx.AsyncClient."""
 
@@ -123,10 +160,37 @@ class PredicateAPIClient:
         http
             Pre-configured async HTTP client used to issue requests.
         settings
-            Retry and timeout configuration.
+            Retry, timeout and concurrency configuration.
         """
         self._http = http
         self._settings = settings
+        limit = settings.max_concurrent_requests
+        self._semaphore: AbstractAsyncContextManager[Any] = (
+            asyncio.Semaphore(limit) if limit is not None else nullcontext()
+        )
+        self._cache: OrderedDict[tuple[Any, ...], PredicateAPIResponse] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(request: PredicateAPIRequest) -> tuple[Any, ...]:
+        """Return the key identifying requests that must yield the same response."""
+        actual, reference = request.actual, request.reference
+        if not request.strict and request.assertion_type not in _LAYOUT_SENSITIVE:
+            actual, reference = _normalize_lines(actual), _normalize_lines(reference)
+        return (request.assertion_type, actual, reference, request.strict, request.enable_reasoning)
+
+    def _retry_delay_s(self, attempt: int, resp: httpx.Response | None = None) -> float:
+        """Return how long to wait before retrying ``attempt``.
+
+        A ``Retry-After`` header in seconds from the service, capped at
+        ``retry_after_max_s``, takes precedence over exponential backoff with jitter.
+        """
+        s = self._settings
+        retry_after: str = resp.headers.get("Retry-After", "") if resp is not None else ""
+        if retry_after.isascii() and retry_after.isdigit():
+            return min(float(retry_after), s.retry_after_max_s)
+        return min(s.retry_max_delay_s, s.retry_base_delay_s * (2.0**attempt)) + random.uniform(
+            0, s.retry_jitter_s
+        )
 
     async def request_predicate(self, request: PredicateAPIRequest) -> PredicateAPIResponse:
         """Run a remote check against the configured service.
@@ -164,18 +228,21 @@ class PredicateAPIClient:
         if s.debugging_mode:
             request.enable_reasoning = True
 
+        key = self._cache_key(request)
+        if s.cache_responses and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
         payload = request.model_dump()
 
         for attempt in range(s.retry_max_attempts):
             try:
-                resp = await self._http.post("assertions/evaluate", json=payload)
+                async with self._semaphore:
+                    resp = await self._http.post("assertions/evaluate", json=payload)
             except (httpx.TimeoutException, httpx.TransportError):
                 if attempt == s.retry_max_attempts - 1:
                     raise
-                delay_s = min(
-                    s.retry_max_delay_s, s.retry_base_delay_s * (2**attempt)
-                ) + random.uniform(0, s.retry_jitter_s)
-                await asyncio.sleep(delay_s)
+                await asyncio.sleep(self._retry_delay_s(attempt))
                 continue
 
             should_retry = resp.status_code in s.retry_status_codes or (
@@ -186,10 +253,7 @@ class PredicateAPIClient:
                     await resp.aread()
                     resp.raise_for_status()
                 await resp.aread()
-                delay_s = min(
-                    s.retry_max_delay_s, s.retry_base_delay_s * (2**attempt)
-                ) + random.uniform(0, s.retry_jitter_s)
-                await asyncio.sleep(delay_s)
+                await asyncio.sleep(self._retry_delay_s(attempt, resp))
                 continue
 
             if resp.status_code in {401, 403}:
@@ -201,10 +265,15 @@ class PredicateAPIClient:
                 )
 
             resp.raise_for_status()
-            final_response = PredicateAPIResponse.model_validate(resp.json())
+            final_response = PredicateAPIResponse.model_validate_json(resp.content)
 
             if s.debugging_mode:
-                logger.info(f"Predicate response: {resp.json()}")
+                logger.info("Predicate response: %s", final_response)
+
+            if s.cache_responses:
+                self._cache[key] = final_response
+                if len(self._cache) > s.cache_max_entries:
+                    self._cache.popitem(last=False)
 
             return final_response
 
@@ -276,6 +345,7 @@ class PredicateAPIFactory:
                         max_keepalive_connections=s.max_keepalive_connections,
                         keepalive_expiry=s.keepalive_expiry,
                     ),
+                    http2=s.http2,
                 )
                 self._client = PredicateAPIClient(self._http, settings=s)
 
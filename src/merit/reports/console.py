@@ -40,6 +40,15 @@ _STATUS_CONFIG: dict[TestStatus, tuple[str, str, str]] = {
     TestStatus.XPASSED: ("!", "magenta", "XPASSED"),
 }
 
+_SUMMARY_LABELS: dict[TestStatus, str] = {
+    TestStatus.PASSED: "passed",
+    TestStatus.FAILED: "failed",
+    TestStatus.ERROR: "errors",
+    TestStatus.SKIPPED: "skipped",
+    TestStatus.XFAILED: "xfailed",
+    TestStatus.XPASSED: "xpassed",
+}
+
 
 class ConsoleReporter(Reporter):
     """Reporter that outputs test results to the console using Rich formatting."""
@@ -175,10 +184,9 @@ class ConsoleReporter(Reporter):
         value = metric.value
         value_str = "N/A" if isinstance(value, float) and math.isnan(value) else str(value)
         assertions = metric.assertion_results
-        passed = sum(1 for a in assertions if a.passed)
+        passed = sum(a.passed for a in assertions)
         total = len(assertions)
-        has_failures = any(not a.passed for a in assertions)
-        return value_str, passed, total, has_failures
+        return value_str, passed, total, passed < total
 
     def _print_metric_row(
         self, label: str, stats: tuple[str, int, int, bool], indent: int = 1
@@ -201,9 +209,8 @@ class ConsoleReporter(Reporter):
         return grouped
 
     def _get_case_label(self, metric: MetricResult) -> str:
-        cases = sorted(metric.metadata.collected_from_cases)
-        if cases:
-            return cases[0]
+        if metric.metadata.collected_from_cases:
+            return min(metric.metadata.collected_from_cases)
         if metric.execution_id:
             return str(metric.execution_id)[:8]
         return "case"
@@ -223,7 +230,7 @@ class ConsoleReporter(Reporter):
         result = execution.result
         item = execution.item
 
-        if result.status in {TestStatus.FAILED, TestStatus.ERROR}:
+        if result.status.is_failure:
             self._failures.append(execution)
 
         if self.verbosity < 0:
@@ -254,7 +261,7 @@ class ConsoleReporter(Reporter):
 
         if execution.sub_executions:
             passed_count = sum(
-                1 for e in execution.sub_executions if e.result.status == TestStatus.PASSED
+                1 for e in execution.sub_executions if e.result.status is TestStatus.PASSED
             )
             total_count = len(execution.sub_executions)
             color = self._status_color(result.status)
@@ -267,13 +274,13 @@ class ConsoleReporter(Reporter):
         self._print_test_line(item.full_name, result, extra=extra)
 
     def _get_status_extra(self, result: TestResult) -> str:
-        if result.status == TestStatus.SKIPPED:
+        if result.status is TestStatus.SKIPPED:
             reason = result.error.args[0] if result.error else "skipped"
             return f"[dim]skipped ({reason})[/dim] "
-        if result.status == TestStatus.XFAILED:
+        if result.status is TestStatus.XFAILED:
             reason = result.error.args[0] if result.error else "expected failure"
             return f"[dim]xfailed ({reason})[/dim] "
-        if result.status == TestStatus.XPASSED:
+        if result.status is TestStatus.XPASSED:
             return "[dim]XPASS[/dim] "
         return ""
 
@@ -281,24 +288,26 @@ class ConsoleReporter(Reporter):
         self, sub_executions: list[TestExecution], indent: int, marker: str
     ) -> None:
         for sub in sub_executions:
-            if sub.result.status in {TestStatus.PASSED, TestStatus.FAILED, TestStatus.ERROR}:
+            if sub.result.status is TestStatus.PASSED or sub.result.status.is_failure:
                 self._print_sub_execution_line(sub, indent, marker)
             if sub.sub_executions:
                 self._print_sub_executions(sub.sub_executions, indent + 2, marker)
 
     async def on_run_complete(self, merit_run: MeritRun) -> None:
         result = merit_run.result
-        if self.verbosity == 0 and self._current_module is not None:
-            self.console.print()
+        # Buffer the whole end-of-run report and write it to the terminal once.
+        with self.console:
+            if self.verbosity == 0 and self._current_module is not None:
+                self.console.print()
 
-        if self.verbosity != 0 and self._failures:
-            self._print_failures()
+            if self.verbosity != 0 and self._failures:
+                self._print_failures()
 
-        if result.stopped_early:
-            self.console.print("[yellow]Run terminated early.[/yellow]")
+            if result.stopped_early:
+                self.console.print("[yellow]Run terminated early.[/yellow]")
 
-        self._print_metric_results(result.metric_results)
-        self._print_summary(merit_run)
+            self._print_metric_results(result.metric_results)
+            self._print_summary(merit_run)
 
     def _print_failures(self) -> None:
         self.console.print()
@@ -350,19 +359,12 @@ class ConsoleReporter(Reporter):
 
     def _print_summary(self, merit_run: MeritRun) -> None:
         result = merit_run.result
+        counts = result.status_counts
         parts = []
-        if result.passed:
-            parts.append(f"[green]{result.passed} passed[/green]")
-        if result.failed:
-            parts.append(f"[red]{result.failed} failed[/red]")
-        if result.errors:
-            parts.append(f"[yellow]{result.errors} errors[/yellow]")
-        if result.skipped:
-            parts.append(f"[yellow]{result.skipped} skipped[/yellow]")
-        if result.xfailed:
-            parts.append(f"[blue]{result.xfailed} xfailed[/blue]")
-        if result.xpassed:
-            parts.append(f"[magenta]{result.xpassed} xpassed[/magenta]")
+        for status, label in _SUMMARY_LABELS.items():
+            if counts[status]:
+                color = self._status_color(status)
+                parts.append(f"[{color}]{counts[status]} {label}[/{color}]")
 
         summary = ", ".join(parts) if parts else "[dim]0 tests[/dim]"
         summary_line = f"run_id: {merit_run.run_id}\n{summary} in {result.total_duration_ms:.0f}ms"
@@ -392,7 +394,7 @@ class ConsoleReporter(Reporter):
         self._print_verbose_metrics(metric_results)
 
     def _print_session_metrics(self, metric_results: list[MetricResult]) -> None:
-        session_metrics = [m for m in metric_results if m.metadata.scope == Scope.SESSION]
+        session_metrics = [m for m in metric_results if m.metadata.scope is Scope.SESSION]
         for metric in session_metrics:
             stats = self._format_metric_value(metric)
             self._print_metric_row(metric.name, stats)
@@ -400,8 +402,8 @@ class ConsoleReporter(Reporter):
             self.console.print()
 
     def _print_verbose_metrics(self, metric_results: list[MetricResult]) -> None:
-        case_metrics = [m for m in metric_results if m.metadata.scope == Scope.CASE]
-        other_metrics = [m for m in metric_results if m.metadata.scope != Scope.CASE]
+        case_metrics = [m for m in metric_results if m.metadata.scope is Scope.CASE]
+        other_metrics = [m for m in metric_results if m.metadata.scope is not Scope.CASE]
 
         for metric in other_metrics:
             stats = self._format_metric_value(metric)
@@ -413,13 +415,11 @@ class ConsoleReporter(Reporter):
 
     def _get_metric_display_name(self, metric: MetricResult) -> str:
         name = metric.name
-        if metric.metadata.scope == Scope.CASE and metric.metadata.collected_from_merits:
-            merits = sorted(metric.metadata.collected_from_merits)
+        if metric.metadata.scope is Scope.CASE and metric.metadata.collected_from_merits:
             case_suffix = ""
             if metric.metadata.collected_from_cases:
-                cases = sorted(metric.metadata.collected_from_cases)
-                case_suffix = escape(f"[{cases[0]}]")
-            name = f"{name}::{merits[0]}{case_suffix}"
+                case_suffix = escape(f"[{min(metric.metadata.collected_from_cases)}]")
+            name = f"{name}::{min(metric.metadata.collected_from_merits)}{case_suffix}"
         return name
 
     def _print_case_metrics(self, case_metrics: list[MetricResult]) -> None:
@@ -118,11 +118,13 @@ class ResourceResolver:
 
     def fork_for_case(self) -> "ResourceResolver":
         """Create a child resolver for isolated CASE-scope execution."""
-        child = ResourceResolver(self._registry, parent=self)
-        for key, value in self._cache.items():
-            if key[0] in {Scope.SUITE, Scope.SESSION}:
-                child._cache[key] = value
-        return child
+        return ResourceResolver(self._registry, parent=self)
+
+    def _cache_for(self, scope: Scope) -> dict[tuple[Scope, str], Any]:
+        """Return the cache holding ``scope`` values; SUITE/SESSION live in the root."""
+        if scope is not Scope.CASE and self._parent:
+            return self._parent._cache_for(scope)
+        return self._cache
 
     def _register_teardown(
         self, scope: Scope, name: str, gen: Generator[Any, None, None] | AsyncGenerator[Any, None]
@@ -139,9 +141,10 @@ class ResourceResolver:
 
         defn = self._registry[name]
         cache_key = (defn.scope, name)
+        cache = self._cache_for(defn.scope)
 
-        if cache_key in self._cache:
-            value = self._cache[cache_key]
+        if cache_key in cache:
+            value = cache[cache_key]
             if defn.on_injection:
                 try:
                     value = defn.on_injection(value)
@@ -183,9 +186,7 @@ class ResourceResolver:
                     f"Hook {defn.on_resolve.__name__} failed for resource '{name}': {e}"
                 ) from e
 
-        self._cache[cache_key] = value
-        if defn.scope in {Scope.SUITE, Scope.SESSION} and self._parent:
-            self._parent._cache[cache_key] = value
+        cache[cache_key] = value
 
         if defn.on_injection:
             try:
@@ -3,12 +3,15 @@
 import json
 import linecache
 import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import cast
 from uuid import UUID
 
+from merit._repr import OrderedRepr
 from merit.assertions.base import AssertionRepr, AssertionResult
 from merit.metrics_.base import CalculatedValue, MetricMetadata, MetricResult
 from merit.predicates.base import PredicateResult
@@ -25,6 +28,22 @@ DEFAULT_DB_NAME = ".merit/merit.db"
 SCHEMA_VERSION = 1
 
 MAX_REPR_LENGTH = 2000  # Max length for repr of local variables
+_SCOPES_BY_VALUE = {s.value: s for s in Scope}
+# Compact separators keep stored JSON small; one encoder is reused for every column.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+# Bounded repr so large locals are never fully rendered just to be truncated.
+_REPR = OrderedRepr(
+    maxlevel=20,
+    maxlist=100,
+    maxtuple=100,
+    maxset=100,
+    maxfrozenset=100,
+    maxdeque=100,
+    maxdict=100,
+    maxstring=MAX_REPR_LENGTH,
+    maxlong=MAX_REPR_LENGTH,
+    maxother=MAX_REPR_LENGTH,
+)
 
 RUN_INSERT_SQL = """
     INSERT INTO runs (
@@ -98,14 +117,19 @@ class SQLiteStore(Store):
                 conn.executescript(SCHEMA)
                 conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode = WAL")
-        conn.execute("PRAGMA synchronous = NORMAL")
-        conn.execute("PRAGMA busy_timeout = 5000")
-        return conn
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one operation, commit on success and always close it.
+
+        A connection per operation keeps the store usable from any thread.
+        """
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA busy_timeout = 5000")
+            yield conn
 
     def _format_traceback(self, error: BaseException) -> str | None:
         if error.__traceback__ is None:
@@ -139,7 +163,7 @@ class SQLiteStore(Store):
 
         # JSON format mirrors rich.traceback so we can reconstruct a display later.
         # But should be usable even outside of Rich.
-        return json.dumps(
+        return _JSON_ENCODER.encode(
             {
                 "exc_type": type(error).__name__,
                 "exc_value": str(error),
@@ -149,7 +173,7 @@ class SQLiteStore(Store):
 
     def _safe_repr(self, value: object) -> str:
         try:
-            r = repr(value)
+            r = _REPR.repr(value)
             return r[:MAX_REPR_LENGTH] + "..." if len(r) > MAX_REPR_LENGTH else r
         except Exception as e:
             return f"<{type(value).__name__} (repr error: {e})>"
@@ -158,6 +182,7 @@ class SQLiteStore(Store):
         """Save a complete test run."""
         with self._connect() as conn:
             run_id = str(run.run_id)
+            counts = run.result.status_counts
             conn.execute(
                 RUN_INSERT_SQL,
                 (
@@ -165,15 +190,15 @@ class SQLiteStore(Store):
                     run.start_time.isoformat(),
                     run.end_time.isoformat() if run.end_time else None,
                     run.result.total_duration_ms,
-                    run.result.passed,
-                    run.result.failed,
-                    run.result.errors,
-                    run.result.skipped,
-                    run.result.xfailed,
-                    run.result.xpassed,
+                    counts[TestStatus.PASSED],
+                    counts[TestStatus.FAILED],
+                    counts[TestStatus.ERROR],
+                    counts[TestStatus.SKIPPED],
+                    counts[TestStatus.XFAILED],
+                    counts[TestStatus.XPASSED],
                     run.result.total,
                     int(run.result.stopped_early),
-                    json.dumps(run.environment.to_dict()),
+                    _JSON_ENCODER.encode(run.environment.to_dict()),
                 ),
             )
 
@@ -187,15 +212,9 @@ class SQLiteStore(Store):
                 error = execution.result.error
                 error_msg = str(error) if error else None
                 error_tb = self._format_traceback(error) if error else None
-                test_name = getattr(defn, "name", str(defn))
-                module_path = getattr(defn, "module_path", None)
+                module_path = defn.module_path
                 file_path = str(module_path) if module_path else None
-                class_name = getattr(defn, "class_name", None)
-                id_suffix = getattr(defn, "id_suffix", None)
-                tags: set[str] = getattr(defn, "tags", set())
-                skip_reason = getattr(defn, "skip_reason", None)
-                xfail_reason = getattr(defn, "xfail_reason", None)
-                case_id = self._parse_case_id(id_suffix)
+                case_id = self._parse_case_id(defn.id_suffix)
                 execution_id = str(execution.execution_id)
 
                 execution_rows.append(
@@ -203,15 +222,15 @@ class SQLiteStore(Store):
                         execution_id,
                         run_id,
                         parent_id,
-                        test_name,
+                        defn.name,
                         file_path,
-                        class_name,
+                        defn.class_name,
                         str(case_id) if case_id else None,
-                        id_suffix,
+                        defn.id_suffix,
                         execution.trace_id,
-                        json.dumps(list(tags)) if tags else None,
-                        skip_reason,
-                        xfail_reason,
+                        self._to_json_list(defn.tags),
+                        defn.skip_reason,
+                        defn.xfail_reason,
                         execution.status.value,
                         execution.duration_ms,
                         error_msg,
@@ -287,7 +306,7 @@ class SQLiteStore(Store):
                 str(run_id),
                 str(execution_id) if execution_id else None,
                 metric_id,
-                json.dumps(asdict(assertion.expression_repr)),
+                _JSON_ENCODER.encode(asdict(assertion.expression_repr)),
                 int(assertion.passed),
                 assertion.error_message,
             ),
@@ -345,7 +364,7 @@ class SQLiteStore(Store):
         if isinstance(value, (int, float)) and not isinstance(value, bool):
             value_real = float(value)
         else:
-            value_json = json.dumps(value)
+            value_json = _JSON_ENCODER.encode(value)
 
         meta = metric.metadata
         cursor = conn.execute(
@@ -391,7 +410,7 @@ class SQLiteStore(Store):
                 )
 
     def _to_json_list(self, items: set[str]) -> str | None:
-        return json.dumps(list(items)) if items else None
+        return _JSON_ENCODER.encode(list(items)) if items else None
 
     def _parse_case_id(self, id_suffix: str | None) -> UUID | None:
         """Extract case_id from id_suffix if it's a valid UUID."""
@@ -552,8 +571,7 @@ class SQLiteStore(Store):
         else:
             value = float("nan")
 
-        scope_str = row["scope"]
-        scope = Scope(scope_str) if scope_str in {s.value for s in Scope} else Scope.SESSION
+        scope = _SCOPES_BY_VALUE.get(row["scope"], Scope.SESSION)
 
         first_at = row["first_recorded_at"]
         last_at = row["last_recorded_at"]
@@ -1,5 +1,8 @@
 """Testing framework for AI agents."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from merit.resources import ResourceResolver, Scope, resource
 from merit.testing.case import Case, iter_cases, validate_cases_for_sut
 from merit.testing.decorators import parametrize, repeat, tag
@@ -29,12 +32,19 @@ from merit.testing.models import (
     TestStatus,
 )
 from merit.testing.outcomes import FailTest, SkipTest, XFailTest, fail, skip, xfail
-from merit.testing.runner import Runner, run
+
+
+if TYPE_CHECKING:
+    from merit.testing.runner import Runner, run
 
 
 # Backwards compatibility alias
 TestItem = MeritTestDefinition
 
+# The runner pulls in reporting and storage, which test modules never need,
+# so it is only imported on first access.
+_LAZY = {"Runner": "merit.testing.runner", "run": "merit.testing.runner"}
+
 __all__ = [
     "Case",
     "DefaultTestFactory",
@@ -76,3 +86,13 @@ __all__ = [
     "validate_cases_for_sut",
     "xfail",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_LAZY[name]), name)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
-from typing import Any, Generic
+from collections.abc import Callable, Iterable, Sequence
+from functools import lru_cache
+from typing import Any, Generic, cast
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -49,8 +50,20 @@ class Case(BaseModel, Generic[RefsT]):
 # Validation engine
 
 
+@lru_cache(maxsize=128)
+def _sut_arguments_validator(sut: Callable[..., Any]) -> SchemaValidator:
+    """Build (once per SUT) a validator for the SUT's call arguments."""
+    schema = generate_arguments_schema(
+        sut,
+        parameters_callback=(
+            lambda index, name, annotation: "skip" if name in {"self", "cls"} else None
+        ),
+    )
+    return SchemaValidator(schema)
+
+
 def validate_cases_for_sut(
-    cases: Sequence[Case[RefsT]],
+    cases: Iterable[Case[RefsT]],
     sut: Callable[..., Any],
     raise_on_invalid: bool = True,
 ) -> Sequence[Case[RefsT]]:
@@ -58,8 +71,8 @@ def validate_cases_for_sut(
 
     Parameters
     ----------
-    cases : Sequence[Case[RefsT]]
-        A collection of test cases to validate.
+    cases : Iterable[Case[RefsT]]
+        Test cases to validate. Generators are consumed in a single pass.
     sut : Callable[..., Any], optional
         The System Under Test to validate against.
     raise_on_invalid : bool, optional
@@ -71,13 +84,7 @@ def validate_cases_for_sut(
         The cases that match the signature of the System Under Test.
     """
     valid_cases = []
-    schema = generate_arguments_schema(
-        sut,
-        parameters_callback=(
-            lambda index, name, annotation: "skip" if name in {"self", "cls"} else None
-        ),
-    )
-    validator = SchemaValidator(schema)
+    validator = _sut_arguments_validator(sut)
     for case in cases:
         input_values = case.sut_input_values or {}
         try:
@@ -95,24 +102,27 @@ def validate_cases_for_sut(
 # Iteration decorator for Merit definitions
 
 
-def iter_cases(*cases: Case[RefsT]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+def iter_cases(
+    *cases: Case[RefsT] | Iterable[Case[RefsT]],
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator to run a test function for each case in the provided sequence.
 
     Parameters
     ----------
-    cases : Sequence[Case[RefsT]]
-        The sequence of test cases to iterate over.
+    cases : Case[RefsT] or Iterable[Case[RefsT]]
+        The test cases to iterate over, or a single iterable of cases such as
+        a list or a generator.
 
     Returns:
     -------
     Callable
         A decorator that applies parametrization to the target function.
     """
-    cases_list = list(cases)
-
-    # backwards compatibility with old API
-    if len(cases_list) == 1 and isinstance(cases_list[0], (list, tuple)):
-        cases_list = list(cases_list[0])
+    cases_list: list[Case[RefsT]]
+    if len(cases) == 1 and not isinstance(cases[0], Case):
+        cases_list = list(cases[0])
+    else:
+        cases_list = cast("list[Case[RefsT]]", list(cases))
 
     ids = [str(c.id) for c in cases_list]
     return parametrize("case", cases_list, ids=ids)
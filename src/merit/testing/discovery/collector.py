@@ -1,9 +1,11 @@
 """Test discovery for merit_* files and functions."""
 
+import hashlib
 import importlib.util
 import inspect
+import os
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from types import ModuleType
 from typing import Any
@@ -13,10 +15,24 @@ from merit.testing.discovery.loader import MeritModuleLoader
 from merit.testing.models import MeritTestDefinition, Modifier
 
 
+# Directories never searched for tests, besides hidden ones such as .git and .venv.
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules", "venv", "build", "dist"})
+
+
+def _iter_test_files(root: Path) -> Iterator[Path]:
+    """Yield merit_*.py files under root without descending into skipped directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS]
+        for name in filenames:
+            if name.startswith("merit_") and name.endswith(".py"):
+                yield Path(dirpath, name)
+
+
 def _load_module(path: Path) -> ModuleType:
     """Dynamically load a Python module from path."""
-    # Use unique module name to avoid collisions
-    module_name = f"merit_discovery.{path.stem}_{hash(path)}"
+    # Use a unique module name that is stable across processes, unlike hash()
+    digest = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+    module_name = f"merit_discovery.{path.stem}_{digest}"
     spec = importlib.util.spec_from_file_location(
         module_name,
         path,
@@ -121,7 +137,7 @@ def collect(path: Path | str | None = None) -> list[MeritTestDefinition]:
             module = _load_module(path)
             items.extend(_collect_from_module(module, path))
     elif path.is_dir():
-        for file_path in path.rglob("merit_*.py"):
+        for file_path in _iter_test_files(path):
             module = _load_module(file_path)
             items.extend(_collect_from_module(module, file_path))
 
@@ -50,7 +50,7 @@ class RepeatedMeritTest(MeritTest):
 
         sub_executions = await asyncio.gather(*tasks)
 
-        passed = sum(1 for e in sub_executions if e.result.status == TestStatus.PASSED)
+        passed = sum(1 for e in sub_executions if e.result.status is TestStatus.PASSED)
         status = TestStatus.PASSED if passed >= self.min_passes else TestStatus.FAILED
         duration = sum(e.result.duration_ms for e in sub_executions)
 
@@ -37,15 +37,14 @@ class ResultBuilder:
     ) -> tuple[TestStatus, Exception | None]:
         """Determine test status and normalize error."""
         expect_failure = definition.xfail_reason is not None
-        failed_assertions = [ar for ar in assertion_results if not ar.passed]
-        has_assertion_failure = len(failed_assertions) > 0
 
         if error is not None and not isinstance(error, AssertionError):
             return (TestStatus.XFAILED if expect_failure else TestStatus.ERROR, error)
 
-        if has_assertion_failure or isinstance(error, AssertionError):
+        first_failure = next((ar for ar in assertion_results if not ar.passed), None)
+        if first_failure is not None or isinstance(error, AssertionError):
             status = TestStatus.XFAILED if expect_failure else TestStatus.FAILED
-            error = self._normalize_error(error, failed_assertions)
+            error = self._normalize_error(error, first_failure)
             return (status, error)
 
         if expect_failure:
@@ -61,10 +60,9 @@ class ResultBuilder:
     def _normalize_error(
         self,
         error: Exception | None,
-        failed_assertions: list[AssertionResult],
+        first_failure: AssertionResult | None,
     ) -> Exception | None:
         """Convert failed assertion to error if no error exists."""
-        if error is None and failed_assertions:
-            msg = failed_assertions[0].error_message or failed_assertions[0].expression_repr.expr
-            return AssertionError(msg)
+        if error is None and first_failure is not None:
+            return AssertionError(first_failure.error_message or first_failure.expression_repr.expr)
         return error
@@ -117,7 +117,7 @@ class SingleMeritTest(MeritTest):
                         await forked_resolver.teardown_scope(Scope.CASE)
                     except Exception as teardown_err:
                         # teardown errors dont mask tests errors
-                        logger.warning(f"Error during resource teardown: {teardown_err}")
+                        logger.warning("Error during resource teardown: %s", teardown_err)
                         if error is None:
                             error = teardown_err
 
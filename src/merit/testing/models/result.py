@@ -25,7 +25,7 @@ class TestStatus(Enum):
     @property
     def is_failure(self) -> bool:
         """Check if this status represents a failure."""
-        return self in {TestStatus.FAILED, TestStatus.ERROR}
+        return self is TestStatus.FAILED or self is TestStatus.ERROR
 
 
 @dataclass
@@ -6,6 +6,7 @@ import os
 import platform
 import socket
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from importlib.metadata import version
@@ -79,35 +80,40 @@ class RunResult:
     total_duration_ms: float = 0
     stopped_early: bool = False
 
+    @property
+    def status_counts(self) -> Counter[TestStatus]:
+        """Count of tests per status, computed in a single pass."""
+        return Counter(e.status for e in self.executions)
+
     @property
     def passed(self) -> int:
         """Count of passed tests."""
-        return sum(1 for e in self.executions if e.status == TestStatus.PASSED)
+        return self.status_counts[TestStatus.PASSED]
 
     @property
     def failed(self) -> int:
         """Count of failed tests."""
-        return sum(1 for e in self.executions if e.status == TestStatus.FAILED)
+        return self.status_counts[TestStatus.FAILED]
 
     @property
     def errors(self) -> int:
         """Count of errored tests."""
-        return sum(1 for e in self.executions if e.status == TestStatus.ERROR)
+        return self.status_counts[TestStatus.ERROR]
 
     @property
     def skipped(self) -> int:
         """Count of skipped tests."""
-        return sum(1 for e in self.executions if e.status == TestStatus.SKIPPED)
+        return self.status_counts[TestStatus.SKIPPED]
 
     @property
     def xfailed(self) -> int:
         """Count of expected failures."""
-        return sum(1 for e in self.executions if e.status == TestStatus.XFAILED)
+        return self.status_counts[TestStatus.XFAILED]
 
     @property
     def xpassed(self) -> int:
         """Count of unexpected passes for xfail tests."""
-        return sum(1 for e in self.executions if e.status == TestStatus.XPASSED)
+        return self.status_counts[TestStatus.XPASSED]
 
     @property
     def total(self) -> int:
@@ -135,6 +141,7 @@ class MeritRun:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the complete run to a dictionary."""
+        counts = self.result.status_counts
         return {
             "run_id": str(self.run_id),
             "start_time": self.start_time.isoformat(),
@@ -142,11 +149,11 @@ class MeritRun:
             "environment": self.environment.to_dict(),
             "total_duration_ms": self.result.total_duration_ms,
             "stopped_early": self.result.stopped_early,
-            "passed": self.result.passed,
-            "failed": self.result.failed,
-            "errors": self.result.errors,
-            "skipped": self.result.skipped,
-            "xfailed": self.result.xfailed,
-            "xpassed": self.result.xpassed,
+            "passed": counts[TestStatus.PASSED],
+            "failed": counts[TestStatus.FAILED],
+            "errors": counts[TestStatus.ERROR],
+            "skipped": counts[TestStatus.SKIPPED],
+            "xfailed": counts[TestStatus.XFAILED],
+            "xpassed": counts[TestStatus.XPASSED],
             "total": self.result.total,
         }
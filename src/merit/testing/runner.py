@@ -197,18 +197,22 @@ class Runner:
             await self._notify_tracing_enabled(self.trace_output)
 
         if self.save_to_db:
-            try:
-                store = SQLiteStore(self.db_path)
-                store.save_run(self.merit_run)
-                if self.enable_tracing:
-                    collector = get_span_collector()
-                    if collector:
-                        store.save_trace_spans(self.merit_run, collector)
-            except Exception as e:
-                warnings.warn(f"Failed to persist run to database: {e}", RuntimeWarning)
+            await asyncio.to_thread(self._persist_run, self.merit_run)
 
         return self.merit_run
 
+    def _persist_run(self, merit_run: MeritRun) -> None:
+        """Save the finished run (and its trace spans) to the SQLite store."""
+        try:
+            store = SQLiteStore(self.db_path)
+            store.save_run(merit_run)
+            if self.enable_tracing:
+                collector = get_span_collector()
+                if collector:
+                    store.save_trace_spans(merit_run, collector)
+        except Exception as e:
+            warnings.warn(f"Failed to persist run to database: {e}", RuntimeWarning)
+
     async def _execute_run(
         self,
         *,
@@ -304,6 +308,17 @@ class Runner:
             await self._notify_run_stopped_early(self.maxfail)
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the event loop used to drive a test run.
+
+    Tasks start eagerly, so test, resource and predicate coroutines that
+    finish without suspending never go through the scheduler.
+    """
+    loop = asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
 def run(path: str | None = None) -> MeritRun:
     """Run tests synchronously (convenience wrapper).
 
@@ -313,4 +328,4 @@ def run(path: str | None = None) -> MeritRun:
     Returns:
         MeritRun with all test outcomes.
     """
-    return asyncio.run(Runner().run(path=path))
+    return asyncio.run(Runner().run(path=path), loop_factory=new_event_loop)
@@ -6,23 +6,56 @@ and any LLM calls made within are automatically captured as child spans.
 """
 
 import inspect
-import os
 import re
 from collections.abc import Callable
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar, cast
 
+from merit._repr import OrderedRepr
 from merit.resources import Scope, resource
-from merit.tracing import get_tracer
+from merit.tracing import get_tracer, trace_content_enabled
 
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+_WORD_START = re.compile(r"(.)([A-Z][a-z]+)")
+_LOWER_UPPER = re.compile(r"([a-z0-9])([A-Z])")
+
+# Bounded repr so large SUT inputs/outputs are never fully rendered for a span.
+_REPR = OrderedRepr(
+    maxlevel=20,
+    maxlist=50,
+    maxtuple=50,
+    maxset=50,
+    maxfrozenset=50,
+    maxdeque=50,
+    maxdict=50,
+    maxstring=1000,
+    maxlong=1000,
+    maxother=1000,
+)
+
 
 def _to_snake_case(name: str) -> str:
     """Convert CamelCase to snake_case."""
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _WORD_START.sub(r"\1_\2", name)
+    return _LOWER_UPPER.sub(r"\1_\2", s1).lower()
+
+
+def _call_key(sig: inspect.Signature, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    """Return a canonical, hashable key for a call, or None if it can't be hashed.
+
+    Argument types are part of the key so that ``1``, ``1.0`` and ``True``
+    don't share a result.
+    """
+    bound = sig.bind(*args, **kwargs)
+    bound.apply_defaults()
+    key = tuple((name, type(v), v) for name, v in bound.arguments.items())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 def sut(
@@ -30,6 +63,7 @@ def sut(
     *,
     name: str | None = None,
     method: str = "__call__",
+    cache: bool = False,
 ) -> Any:
     """Register a callable as a traced system-under-test resource.
 
@@ -44,6 +78,11 @@ def sut(
         fn: The callable to register as SUT.
         name: Optional name override (defaults to function/class name).
         method: The method name to trace for class-based SUTs (default: "__call__").
+        cache: Reuse the result of an earlier call with the same arguments for
+            the rest of the session. Positional and keyword forms of the same
+            call share a result; calls with unhashable arguments are not cached.
+            Cache hits still emit a ``sut.<name>`` span, marked with
+            ``merit.sut.cached``. Only supported for function SUTs.
 
     Example:
         @sut
@@ -64,7 +103,7 @@ def sut(
             agent.run("Task")
     """
     if fn is None:
-        return lambda f: sut(f, name=name, method=method)
+        return lambda f: sut(f, name=name, method=method, cache=cache)
 
     if name:
         sut_name = name
@@ -74,18 +113,23 @@ def sut(
         sut_name = fn.__name__
 
     if inspect.isclass(fn):
+        if cache:
+            msg = f"@sut(cache=True) is not supported for class-based SUT '{fn.__name__}'"
+            raise ValueError(msg)
         return _wrap_class(fn, sut_name, method)
 
-    return _wrap_callable(fn, sut_name)
+    return _wrap_callable(fn, sut_name, cache)
 
 
-def _wrap_callable(fn: Callable[P, T], sut_name: str) -> Callable[[], Callable[P, T]]:
+def _wrap_callable(fn: Callable[P, T], sut_name: str, cache: bool) -> Callable[[], Callable[P, T]]:
     """Wrap a function (sync or async) with tracing and register as resource.
 
     Returns a factory that creates the traced callable, so the resource
     system doesn't try to resolve the original function's parameters.
+    With ``cache``, each session gets its own memo of results by arguments.
     """
     is_async = inspect.iscoroutinefunction(fn)
+    sig = inspect.signature(fn)
 
     if is_async:
 
@@ -99,9 +143,6 @@ def _wrap_callable(fn: Callable[P, T], sut_name: str) -> Callable[[], Callable[P
                 _set_output_attrs(span, result)
                 return result
 
-        def factory() -> Callable[P, T]:
-            return traced  # type: ignore[return-value]
-
     else:
 
         def traced(*args: P.args, **kwargs: P.kwargs) -> T:  # type: ignore[misc]
@@ -114,8 +155,37 @@ def _wrap_callable(fn: Callable[P, T], sut_name: str) -> Callable[[], Callable[P
                 _set_output_attrs(span, result)
                 return result
 
-        def factory() -> Callable[P, T]:
+    def factory() -> Callable[P, T]:
+        if not cache:
             return traced  # type: ignore[return-value]
+        results: dict[Any, T] = {}
+
+        if is_async:
+
+            async def cached(*args: P.args, **kwargs: P.kwargs) -> T:
+                key = _call_key(sig, args, kwargs)
+                if key is None:
+                    return await traced(*args, **kwargs)
+                if key in results:
+                    _trace_cache_hit(sut_name, args, kwargs, results[key])
+                    return results[key]
+                results[key] = result = await traced(*args, **kwargs)
+                return result
+
+        else:
+            call = cast("Callable[P, T]", traced)
+
+            def cached(*args: P.args, **kwargs: P.kwargs) -> T:  # type: ignore[misc]
+                key = _call_key(sig, args, kwargs)
+                if key is None:
+                    return call(*args, **kwargs)
+                if key in results:
+                    _trace_cache_hit(sut_name, args, kwargs, results[key])
+                    return results[key]
+                results[key] = result = call(*args, **kwargs)
+                return result
+
+        return cached  # type: ignore[return-value]
 
     factory.__name__ = sut_name
     factory.__doc__ = fn.__doc__
@@ -191,7 +261,7 @@ def _wrap_class(cls: type, sut_name: str, method_name: str) -> Callable[[], Any]
 
 def _set_input_attrs(span: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
     """Set input attributes on span, respecting trace content settings."""
-    if os.environ.get("MERIT_TRACE_CONTENT", "true").lower() != "true":
+    if not trace_content_enabled():
         span.set_attribute("sut.input.count", len(args) + len(kwargs))
         return
 
@@ -201,9 +271,22 @@ def _set_input_attrs(span: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -
         span.set_attribute("sut.input.kwargs", _truncate_repr(kwargs))
 
 
+def _trace_cache_hit(
+    sut_name: str, args: tuple[Any, ...], kwargs: dict[str, Any], result: Any
+) -> None:
+    """Emit the span for a SUT call answered from the cache."""
+    tracer = get_tracer()
+    with tracer.start_as_current_span(f"sut.{sut_name}") as span:
+        span.set_attribute("merit.sut", True)
+        span.set_attribute("merit.sut.name", sut_name)
+        span.set_attribute("merit.sut.cached", True)
+        _set_input_attrs(span, args, kwargs)
+        _set_output_attrs(span, result)
+
+
 def _set_output_attrs(span: Any, result: Any) -> None:
     """Set output attributes on span, respecting trace content settings."""
-    if os.environ.get("MERIT_TRACE_CONTENT", "true").lower() != "true":
+    if not trace_content_enabled():
         span.set_attribute("sut.output.type", type(result).__name__)
         return
 
@@ -213,7 +296,7 @@ def _set_output_attrs(span: Any, result: Any) -> None:
 def _truncate_repr(value: Any, max_len: int = 1000) -> str:
     """Truncate a repr string if too long."""
     try:
-        s = repr(value)
+        s = _REPR.repr(value)
         if len(s) <= max_len:
             return s
         return s[: max_len - 3] + "..."
@@ -6,6 +6,7 @@ from merit.tracing.lifecycle import (
     get_tracer,
     init_tracing,
     set_trace_output_path,
+    trace_content_enabled,
     trace_step,
 )
 
@@ -18,5 +19,6 @@ __all__ = [
     "get_tracer",
     "init_tracing",
     "set_trace_output_path",
+    "trace_content_enabled",
     "trace_step",
 ]
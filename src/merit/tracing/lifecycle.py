@@ -9,6 +9,7 @@ convenience context manager `trace_step`.
 # lifecycle-related responsibilities (initialization, exporter, provider,
 # instrumentation, and tracing helpers).
 
+import importlib
 import os
 from collections import defaultdict
 from collections.abc import Sequence
@@ -18,8 +19,6 @@ from threading import Lock
 from typing import Any
 
 from opentelemetry import trace
-from opentelemetry.instrumentation.anthropic import AnthropicInstrumentor
-from opentelemetry.instrumentation.openai import OpenAIInstrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExporter, SpanExportResult
@@ -60,9 +59,17 @@ class InMemorySpanCollector(SpanExporter):
         return True
 
 
+# Instrumentor modules import the full provider SDKs, so they are only
+# loaded once tracing is initialized.
+_LLM_INSTRUMENTORS = {
+    "opentelemetry.instrumentation.openai": "OpenAIInstrumentor",
+    "opentelemetry.instrumentation.anthropic": "AnthropicInstrumentor",
+}
+
 _exporter: StreamingFileSpanExporter | None = None
 _collector: InMemorySpanCollector | None = None
 _initialized = False
+_trace_content: bool | None = None
 
 
 def init_tracing(
@@ -76,14 +83,14 @@ def init_tracing(
     Must be called before any LLM clients are instantiated to ensure
     instrumentation captures all calls.
     """
-    global _exporter, _collector, _initialized
+    global _exporter, _collector, _initialized, _trace_content
 
     if _initialized:
         return
 
     # Configure trace content capture
-    if trace_content is None:
-        trace_content = os.environ.get("MERIT_TRACE_CONTENT", "true").lower() == "true"
+    if trace_content is not None:
+        _trace_content = trace_content
 
     # Set up streaming exporter
     _exporter = StreamingFileSpanExporter(output_path)
@@ -100,6 +107,18 @@ def init_tracing(
     _initialized = True
 
 
+def trace_content_enabled() -> bool:
+    """Whether SUT inputs and outputs are recorded on spans.
+
+    The ``trace_content`` argument of `init_tracing` takes precedence;
+    otherwise ``MERIT_TRACE_CONTENT`` is read on each call so values loaded
+    from ``.env`` or set after import are honored.
+    """
+    if _trace_content is not None:
+        return _trace_content
+    return os.environ.get("MERIT_TRACE_CONTENT", "true").lower() == "true"
+
+
 def get_span_collector() -> InMemorySpanCollector | None:
     """Get the in-memory span collector for querying trace data."""
     return _collector
@@ -115,17 +134,15 @@ def set_trace_output_path(output_path: Path | str) -> None:
         # If not initialized, initialize it
         init_tracing(output_path=output_path)
     else:
-        _exporter.output_path = Path(output_path)
-        _exporter.output_path.parent.mkdir(parents=True, exist_ok=True)
-        _exporter.output_path.write_text("")
+        _exporter.reset(output_path)
 
 
 def _instrument_llm_clients() -> None:
     """Instrument OpenAI and Anthropic clients."""
     # Note: These instrumentors capture content by default.
     # If privacy controls are needed, we can configure them here.
-    OpenAIInstrumentor().instrument()
-    AnthropicInstrumentor().instrument()
+    for module, instrumentor in _LLM_INSTRUMENTORS.items():
+        getattr(importlib.import_module(module), instrumentor)().instrument()
 
 
 def get_tracer(name: str = "merit") -> trace.Tracer:
@@ -136,8 +153,7 @@ def get_tracer(name: str = "merit") -> trace.Tracer:
 def clear_traces() -> None:
     """Clear the trace file and in-memory collector."""
     if _exporter is not None:
-        # Re-initialize the file (clears content)
-        _exporter.output_path.write_text("")
+        _exporter.reset()
     if _collector is not None:
         _collector.clear_all()
 
@@ -3,7 +3,11 @@ from typing import Any
 import pytest
 from pydantic import BaseModel, ValidationError
 
-from merit.testing.case import Case, iter_cases, validate_cases_for_sut
+from merit.testing.case import (
+    Case,
+    iter_cases,
+    validate_cases_for_sut,
+)
 from merit.testing.models import ParametrizeModifier
 
 
@@ -78,3 +82,33 @@ def test_iter_cases_decorator():
     # Check that IDs are correctly set from case IDs
     assert param_sets[0].id_suffix == str(cases[0].id)
     assert param_sets[1].id_suffix == str(cases[1].id)
+
+
+def test_iter_cases_accepts_generator():
+    """Test iter_cases consumes a generator of cases passed as a single argument."""
+    cases = [Case(sut_input_values={"x": 1}), Case(sut_input_values={"x": 2})]
+
+    @iter_cases(case for case in cases)
+    def my_test(case):
+        pass
+
+    param_sets = my_test.__merit_modifiers__[0].parameter_sets
+    assert [p.values["case"] for p in param_sets] == cases
+
+
+def test_validate_cases_for_sut_repeated_validation_per_sut():
+    """Test repeated validation keeps checking each SUT against its own signature."""
+
+    def named_sut(name: str):
+        pass
+
+    def aged_sut(age: int):
+        pass
+
+    alice = Case(sut_input_values={"name": "Alice"})
+    assert validate_cases_for_sut([alice], named_sut) == [alice]
+    assert validate_cases_for_sut([alice], named_sut, raise_on_invalid=False) == [alice]
+    assert validate_cases_for_sut([alice], aged_sut, raise_on_invalid=False) == []
+
+    with pytest.raises(ValidationError):
+        validate_cases_for_sut([Case(sut_input_values={"name": 1})], named_sut)
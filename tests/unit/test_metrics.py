@@ -1,5 +1,6 @@
 import math
 import statistics
+from enum import IntEnum
 from pathlib import Path
 
 import pytest
@@ -57,6 +58,28 @@ def test_metric_computations():
     assert math.isclose(m.pstd, statistics.pstdev([10, 20, 30, 40, 50]))
 
 
+def test_metric_mean_handles_infinite_and_huge_values():
+    """mean stays defined where an exact float sum would raise."""
+    m = Metric("test_inf")
+    m.add_record([math.inf, -math.inf])
+    assert math.isnan(m.mean)
+
+    m = Metric("test_huge")
+    m.add_record([1e308, 1e308])
+    assert m.mean == 1e308
+
+
+def test_metric_order_statistics_follow_new_records():
+    """min/max/median are recomputed from sorted values after each add_record."""
+    m = Metric("test_order")
+    m.add_record([40, 10, 30, 20])
+
+    assert (m.min, m.max, m.median) == (10.0, 40.0, 25.0)
+
+    m.add_record(5)
+    assert (m.min, m.max, m.median) == (5.0, 40.0, 20.0)
+
+
 def test_metric_percentiles():
     """Test percentile computations."""
     m = Metric("test_percentiles")
@@ -123,6 +146,29 @@ def test_metric_timestamps():
     assert m.metadata.last_item_recorded_at > t2
 
 
+def test_metric_add_record_coerces_or_rejects_non_numeric_values():
+    m = Metric("typed")
+    m.add_record("3")
+    m.add_record([1, "2"])
+    assert m.raw_values == [3, 1, 2]
+
+    with pytest.raises(ValueError):
+        m.add_record("three")
+    assert m.raw_values == [3, 1, 2]
+
+
+def test_metric_add_record_accepts_numeric_subclasses_in_sequences():
+    class Level(IntEnum):
+        LOW = 1
+        HIGH = 2
+
+    m = Metric("levels")
+    m.add_record(Level.LOW)
+    m.add_record([Level.HIGH])
+    m.add_record((Level.LOW, 3.5))
+    assert m.raw_values == [1, 2, 1, 3.5]
+
+
 def test_metric_empty_edge_cases_do_not_crash():
     m = Metric("empty")
     assert math.isnan(m.pvariance)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import httpx
@@ -17,6 +18,7 @@ from merit.predicates.base import PredicateResult, predicate
 from merit.predicates.client import (
     PredicateAPIClient,
     PredicateAPIFactory,
+    PredicateAPIRequest,
     PredicateAPISettings,
     PredicateType,
     close_predicate_api_client,
@@ -103,6 +105,162 @@ async def test_remote_predicate_client_check_posts_payload_and_parses_response()
     assert result.reasoning == "nope"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("limit", "expected_peak"), [(2, 2), (None, 6)])
+async def test_remote_predicate_client_limits_requests_in_flight(
+    limit: int | None, expected_peak: int
+) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(status_code=200, json={"passed": True, "confidence": 1.0})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(base_url="https://example.com/", transport=transport) as http:
+        settings = PredicateAPISettings.model_validate(
+            {
+                "MERIT_API_BASE_URL": "https://example.com",
+                "MERIT_API_KEY": "secret",
+                "MERIT_API_MAX_CONCURRENCY": limit,
+            }
+        )
+        client = PredicateAPIClient(http=http, settings=settings)
+
+        await asyncio.gather(
+            *(
+                client.request_predicate(
+                    PredicateAPIRequest(
+                        actual=f"actual {i}",
+                        reference="reference",
+                        assertion_type=PredicateType.HAS_TOPICS,
+                    )
+                )
+                for i in range(6)
+            )
+        )
+
+    assert peak == expected_peak
+
+
+@pytest.mark.asyncio
+async def test_remote_predicate_client_reuses_cached_responses() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(status_code=200, json={"passed": True, "confidence": 0.5})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(base_url="https://example.com/", transport=transport) as http:
+        settings = PredicateAPISettings.model_validate(
+            {
+                "MERIT_API_BASE_URL": "https://example.com",
+                "MERIT_API_KEY": "secret",
+                "MERIT_API_CACHE_RESPONSES": True,
+            }
+        )
+        client = PredicateAPIClient(http=http, settings=settings)
+
+        def make_request(
+            actual: str, assertion_type: PredicateType = PredicateType.HAS_TOPICS
+        ) -> PredicateAPIRequest:
+            return PredicateAPIRequest(
+                actual=actual,
+                reference="reference",
+                assertion_type=assertion_type,
+                strict=False,
+            )
+
+        first = await client.request_predicate(make_request("actual"))
+        second = await client.request_predicate(make_request("actual"))
+        await client.request_predicate(make_request("other"))
+        indented = await client.request_predicate(make_request("\n    actual\n    "))
+        nested = await client.request_predicate(
+            make_request("- a\n  - b", PredicateType.STYLE_MATCH)
+        )
+        flat = await client.request_predicate(make_request("- a\n- b", PredicateType.STYLE_MATCH))
+
+    assert first is second
+    assert indented is first
+    assert nested is not flat
+    assert calls == 4
+
+
+@pytest.mark.asyncio
+async def test_remote_predicate_client_evicts_least_recently_used_response() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(status_code=200, json={"passed": True, "confidence": 0.5})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(base_url="https://example.com/", transport=transport) as http:
+        settings = PredicateAPISettings.model_validate(
+            {
+                "MERIT_API_BASE_URL": "https://example.com",
+                "MERIT_API_KEY": "secret",
+                "MERIT_API_CACHE_RESPONSES": True,
+                "MERIT_API_CACHE_MAX_ENTRIES": 2,
+            }
+        )
+        client = PredicateAPIClient(http=http, settings=settings)
+
+        for actual in ["a", "b", "a", "c", "a", "b"]:
+            await client.request_predicate(
+                PredicateAPIRequest(
+                    actual=actual, reference="ref", assertion_type=PredicateType.HAS_TOPICS
+                )
+            )
+
+    assert calls == 4
+
+
+@pytest.mark.asyncio
+async def test_remote_predicate_client_honors_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    retry_after = iter([b"2", b"3600", "\u00b2".encode()])
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        value = next(retry_after, None)
+        if value is not None:
+            return httpx.Response(status_code=429, headers={"Retry-After": value})
+        return httpx.Response(status_code=200, json={"passed": True, "confidence": 0.5})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(base_url="https://example.com/", transport=transport) as http:
+        settings = PredicateAPISettings.model_validate(
+            {
+                "MERIT_API_BASE_URL": "https://example.com",
+                "MERIT_API_KEY": "secret",
+                "retry_base_delay_s": 30.0,
+                "retry_max_delay_s": 30.0,
+                "retry_after_max_s": 5.0,
+            }
+        )
+        client = PredicateAPIClient(http=http, settings=settings)
+        resp = await client.request_predicate(
+            PredicateAPIRequest(actual="a", reference="b", assertion_type=PredicateType.HAS_TOPICS)
+        )
+
+    assert resp.passed is True
+    assert sleeps[:2] == [2.0, 5.0]
+    assert sleeps[2] >= 30.0
+
+
 @pytest.mark.asyncio
 async def test_module_level_get_and_close_work(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("MERIT_API_BASE_URL", "https://example.com")
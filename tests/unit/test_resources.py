@@ -150,6 +150,23 @@ class TestResourceResolver:
         assert v1 == v2 == 1
         assert call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_sibling_children_share_suite_resolved_after_fork(self):
+        call_count = 0
+
+        @resource(scope="suite")
+        def late_suite():
+            nonlocal call_count
+            call_count += 1
+            return call_count
+
+        parent = ResourceResolver(get_registry())
+        child1 = parent.fork_for_case()
+        child2 = parent.fork_for_case()
+
+        assert await child1.resolve("late_suite") == await child2.resolve("late_suite") == 1
+        assert call_count == 1
+
     @pytest.mark.asyncio
     async def test_resolves_dependencies(self):
         @resource
@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 
 from merit.resources import clear_registry, resource
+from merit.testing.discovery import collect
 from merit.testing.environment import _filter_env_vars, capture_environment
 from merit.testing.models import (
     RunEnvironment,
@@ -614,3 +615,23 @@ class TestResourceResolutionErrors:
 
         # Both tests should error due to suite resource failure
         assert result.result.errors == 2
+
+
+class TestDiscovery:
+    """Tests for collecting test files from a directory."""
+
+    def test_collect_skips_hidden_and_tooling_directories(self, tmp_path):
+        test_source = "def merit_found():\n    pass\n"
+        (tmp_path / "merit_top.py").write_text(test_source)
+        for skipped in (".venv", "node_modules", "__pycache__"):
+            (tmp_path / skipped).mkdir()
+            (tmp_path / skipped / "merit_skipped.py").write_text(test_source)
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "merit_nested.py").write_text(test_source)
+
+        items = collect(tmp_path)
+
+        assert sorted(item.module_path.name for item in items) == [
+            "merit_nested.py",
+            "merit_top.py",
+        ]
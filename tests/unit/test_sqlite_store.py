@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -233,3 +234,10 @@ def test_sqlite_store_assertions_and_predicates(tmp_path: Path) -> None:
     assert any(
         json.loads(row["expression_repr"])["expr"] == "metric > 0" for row in run_assertions
     )
+
+
+def test_sqlite_store_is_usable_from_another_thread(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "merit.db")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(store.list_runs).result() == []
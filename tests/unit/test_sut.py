@@ -119,6 +119,76 @@ class TestSutResolution:
         result = await resolved(2, 3)
         assert result == 5
 
+    @pytest.mark.asyncio
+    async def test_cached_sut_reuses_results_per_session(self):
+        calls = 0
+
+        @sut(cache=True)
+        async def counting_sut(prompt: str) -> str:
+            nonlocal calls
+            calls += 1
+            return prompt.upper()
+
+        resolved = await ResourceResolver(get_registry()).resolve("counting_sut")
+        assert await resolved("hi") == await resolved(prompt="hi") == await resolved("hi")
+        assert calls == 1
+
+        fresh = await ResourceResolver(get_registry()).resolve("counting_sut")
+        assert await fresh("hi") == "HI"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_sut_keys_on_argument_types_and_traces_hits(self):
+        import json
+
+        @sut(cache=True)
+        def typed_sut(x: object) -> str:
+            return type(x).__name__
+
+        resolved = await ResourceResolver(get_registry()).resolve("typed_sut")
+        assert [resolved(1), resolved(1.0), resolved(True), resolved(1)] == [
+            "int",
+            "float",
+            "bool",
+            "int",
+        ]
+
+        from merit.tracing.lifecycle import _exporter
+
+        assert _exporter is not None
+        spans = [json.loads(line) for line in _exporter.output_path.read_text().splitlines()]
+        sut_spans = [s for s in spans if s["name"] == "sut.typed_sut"]
+        assert len(sut_spans) == 4
+        assert [s["attributes"].get("merit.sut.cached", False) for s in sut_spans] == [
+            False,
+            False,
+            False,
+            True,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cached_sut_calls_through_for_unhashable_arguments(self):
+        calls = 0
+
+        @sut(cache=True)
+        def chat_sut(messages: list[dict[str, str]]) -> int:
+            nonlocal calls
+            calls += 1
+            return len(messages)
+
+        resolved = await ResourceResolver(get_registry()).resolve("chat_sut")
+        messages = [{"role": "user", "content": "hi"}]
+        assert resolved(messages) == resolved(messages) == 1
+        assert calls == 2
+
+    def test_cache_rejects_class_sut(self):
+        with pytest.raises(ValueError, match="not supported for class-based SUT"):
+
+            @sut(cache=True)
+            class Agent:
+                def __call__(self, task: str) -> str:
+                    return task
+
     @pytest.mark.asyncio
     async def test_resolves_class_sut(self):
         @sut
@@ -294,3 +364,22 @@ class TestSnakeCaseConversion:
         attributes = span["attributes"]
         assert attributes.get("merit.sut") is True
         assert attributes.get("merit.sut.name") == "my_test_function"
+
+    @pytest.mark.asyncio
+    async def test_sut_output_repr_keeps_order_and_nesting(self):
+        import json
+
+        @sut
+        def echo(value: object) -> object:
+            return value
+
+        resolver = ResourceResolver(get_registry())
+        resolved = await resolver.resolve("echo")
+        resolved({"zeta": 1, "alpha": [[[[[[[2]]]]]]]})
+
+        from merit.tracing.lifecycle import _exporter
+
+        assert _exporter is not None
+        spans = [json.loads(line) for line in _exporter.output_path.read_text().splitlines()]
+        span = next(s for s in spans if s["name"] == "sut.echo")
+        assert span["attributes"]["sut.output"] == "{'zeta': 1, 'alpha': [[[[[[[2]]]]]]]}"
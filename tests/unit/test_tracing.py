@@ -11,6 +11,7 @@ from merit.tracing import (
     get_tracer,
     init_tracing,
     set_trace_output_path,
+    trace_content_enabled,
     trace_step,
 )
 
@@ -46,6 +47,14 @@ class TestInitTracing:
         assert tracer is not None
 
 
+def test_trace_content_reads_env_set_after_import(monkeypatch):
+    monkeypatch.setenv("MERIT_TRACE_CONTENT", "false")
+    assert trace_content_enabled() is False
+
+    monkeypatch.delenv("MERIT_TRACE_CONTENT")
+    assert trace_content_enabled() is True
+
+
 @pytest.mark.usefixtures("trace_output_path")
 class TestTraceStep:
     """Tests for trace_step context manager."""